@@ -5,19 +5,23 @@ and files.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import enum
 import json
 import logging
+import os
 import pathlib
+import pickle
 import sys
 from dataclasses import dataclass
-from typing import Generator, Optional, Sequence, Type, TypeVar, Union
+from typing import (TYPE_CHECKING, Any, Generator, Iterable, Optional,
+                    Sequence, Type, TypeVar, Union)
 
 import lark
 
 import blark
 
-from . import solution, summary
+from . import solution
 from . import transform as tf
 from . import util
 from .input import BlarkCompositeSourceItem, BlarkSourceItem, load_file_by_name
@@ -29,6 +33,10 @@ try:
 except ImportError:
     apischema = None
 
+if TYPE_CHECKING:
+    # Only needed for 'blark parse --summary'; imported on demand
+    from . import summary
+
 
 logger = logging.getLogger(__name__)
 
@@ -53,24 +61,52 @@ class BlarkStartingRule(enum.Enum):
     statement_list = enum.auto()
 
 
-def new_parser(start: Optional[list[str]] = None, **kwargs) -> lark.Lark:
+def new_parser(
+    start: Optional[list[str]] = None,
+    parser: str = "earley",
+    propagate_positions: bool = True,
+    maybe_placeholders: bool = True,
+    **kwargs,
+) -> lark.Lark:
     """
     Get a new parser for TwinCAT flavor IEC61131-3 code.
 
     Parameters
     ----------
+    start : list of str, optional
+        The starting rules to support.  Defaults to all of
+        :class:`BlarkStartingRule`.
+    parser : str, optional
+        The lark parser algorithm to use.  Defaults to "earley", as the blark
+        grammar is ambiguous and not LALR(1)-compatible in its entirety.
+        "lalr" may be used with custom starting rules that the LALR parser
+        can handle.
+    propagate_positions : bool, optional
+        Propagate line and column information to the parse tree.  Defaults
+        to True.  Transformed code and summaries rely on this information to
+        annotate comments and to extract per-item source code; disabling it
+        saves time only when parse trees are used directly.
+    maybe_placeholders : bool, optional
+        Use ``None`` placeholders for unmatched optional ``[...]`` items.
+        Defaults to True, which ``GrammarTransformer`` requires.
     **kwargs :
-        See :class:`lark.lark.LarkOptions`.
+        See :class:`lark.lark.LarkOptions`.  For the "lalr" parser, ``cache``
+        defaults to True, persisting the compiled parse tables in the
+        temporary directory (keyed by grammar contents and options).
     """
     if start is None:
         start = [rule.name for rule in BlarkStartingRule]
 
+    if parser == "lalr":
+        # NOTE: lark only supports caching of LALR parse tables
+        kwargs.setdefault("cache", True)
+
     return lark.Lark.open_from_package(
         "blark",
         blark.GRAMMAR_FILENAME.name,
-        parser="earley",
-        maybe_placeholders=True,
-        propagate_positions=True,
+        parser=parser,
+        maybe_placeholders=maybe_placeholders,
+        propagate_positions=propagate_positions,
         start=start,
         **kwargs,
     )
@@ -221,12 +257,173 @@ def parse_single_file(fn: AnyPath, **kwargs) -> ParseResult:
 
 def parse_project(
     tsproj_project: AnyFile,
+    *,
+    jobs: Optional[int] = 1,
     **kwargs,
 ) -> Generator[ParseResult, None, None]:
-    """Parse an entire tsproj project file."""
+    """
+    Parse an entire tsproj project file.
+
+    Parameters
+    ----------
+    tsproj_project : pathlib.Path or str
+        The project (or solution) filename.
+
+    jobs : int, optional
+        The number of processes to parse with.  Defaults to 1, parsing
+        serially in this process.  ``None`` or 0 uses one process per CPU.
+
+    **kwargs :
+        Passed through to :func:`parse_source_code`.
+    """
     sol = solution.make_solution_from_files(tsproj_project)
-    for item in solution.get_blark_input_from_solution(sol):
-        yield from parse_item(item, **kwargs)
+    yield from parse_items(
+        solution.get_blark_input_from_solution(sol),
+        jobs=jobs,
+        **kwargs,
+    )
+
+
+def _get_item_parse_arguments(item: BlarkSourceItem) -> Optional[dict[str, Any]]:
+    """Get the ``parse_source_code`` arguments for a single source item."""
+    code, line_map = item.get_code_and_line_map()
+
+    try:
+        filename = list(item.get_filenames())[0]
+    except IndexError:
+        if not item.lines:
+            return None
+        filename = None
+
+    return dict(
+        source_code=code,
+        starting_rule=item.grammar_rule,
+        line_map=line_map,
+        fn=filename or "unknown",
+    )
+
+
+def _flatten_item(
+    item: Union[BlarkSourceItem, BlarkCompositeSourceItem],
+) -> Generator[tuple[BlarkSourceItem, Optional[BlarkCompositeSourceItem]], None, None]:
+    """
+    Get all source items from ``item`` along with their outermost parent.
+
+    This mirrors the ``parent`` that :func:`parse_item` assigns to results.
+    """
+    if not isinstance(item, BlarkCompositeSourceItem):
+        yield item, None
+        return
+
+    for part in item.parts:
+        for leaf, _ in _flatten_item(part):
+            yield leaf, item
+
+
+def _parse_in_subprocess(
+    arguments: dict[str, Any], kwargs: dict[str, Any]
+) -> Optional[ParseResult]:
+    """Process pool worker: parse source code from ``parse_items``."""
+    result = parse_source_code(**arguments, **kwargs)
+    if result.exception is not None:
+        # lark exceptions can't be pickled; the caller will re-parse this one
+        return None
+    return result
+
+
+def _can_pickle(obj: Any) -> bool:
+    """Can ``obj`` be pickled, and so sent to a worker process?"""
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def _set_result_source(
+    result: ParseResult,
+    leaf: BlarkSourceItem,
+    parent: Optional[BlarkCompositeSourceItem],
+) -> ParseResult:
+    """Record the source item (and its parent, if any) on ``result``."""
+    result.item = leaf
+    if parent is not None:
+        result.parent = parent
+    return result
+
+
+def parse_items(
+    items: Iterable[Union[BlarkSourceItem, BlarkCompositeSourceItem]],
+    *,
+    jobs: Optional[int] = 1,
+    **kwargs,
+) -> Generator[ParseResult, None, None]:
+    """
+    Parse the given source items, optionally using a pool of processes.
+
+    Results are yielded in the order of ``items``, regardless of ``jobs``.
+
+    Parameters
+    ----------
+    items : iterable of BlarkSourceItem or BlarkCompositeSourceItem
+        The items to parse.
+
+    jobs : int, optional
+        The number of processes to parse with.  Defaults to 1, parsing
+        serially in this process.  ``None`` or 0 uses one process per CPU
+        available to this process.  Keyword arguments must be sent to worker
+        processes, so parsing is always serial when a custom ``parser`` is
+        specified or when any of them cannot be pickled (e.g., a ``lambda``
+        in ``preprocessors``).
+
+    **kwargs :
+        Passed through to :func:`parse_source_code`.
+    """
+    if jobs is not None and jobs < 0:
+        raise ValueError(f"jobs must be non-negative or None, not {jobs}")
+
+    if jobs == 1 or "parser" in kwargs or not _can_pickle(kwargs):
+        for item in items:
+            yield from parse_item(item, **kwargs)
+        return
+
+    to_parse = []
+    for item in items:
+        for leaf, parent in _flatten_item(item):
+            arguments = _get_item_parse_arguments(leaf)
+            if arguments is not None:
+                to_parse.append((leaf, parent, arguments))
+
+    if len(to_parse) < 2:
+        # Not worth starting a process pool for
+        for leaf, parent, arguments in to_parse:
+            result = parse_source_code(**arguments, **kwargs)
+            yield _set_result_source(result, leaf, parent)
+        return
+
+    if not jobs:
+        jobs = None
+    if jobs is None and hasattr(os, "sched_getaffinity"):
+        jobs = len(os.sched_getaffinity(0))
+
+    # Workers forked from this process can reuse an already-built parser
+    get_parser()
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    futures = []
+    try:
+        futures = [
+            executor.submit(_parse_in_subprocess, arguments, kwargs)
+            for _, _, arguments in to_parse
+        ]
+        for (leaf, parent, arguments), future in zip(to_parse, futures):
+            result = future.result()
+            if result is None:
+                result = parse_source_code(**arguments, **kwargs)
+            yield _set_result_source(result, leaf, parent)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
 
 
 def parse_item(
@@ -241,22 +438,11 @@ def parse_item(
                 yield res
         return
 
-    code, line_map = item.get_code_and_line_map()
-
-    try:
-        filename = list(item.get_filenames())[0]
-    except IndexError:
-        if not item.lines:
-            return
-        filename = None
+    arguments = _get_item_parse_arguments(item)
+    if arguments is None:
+        return
 
-    result = parse_source_code(
-        code,
-        starting_rule=item.grammar_rule,
-        line_map=line_map,
-        fn=filename or "unknown",
-        **kwargs,
-    )
+    result = parse_source_code(**arguments, **kwargs)
     result.item = item
     yield result
 
@@ -264,13 +450,41 @@ def parse_item(
 def parse(
     path: AnyPath,
     input_format: Optional[str] = None,
+    *,
+    jobs: Optional[int] = 1,
     **kwargs,
 ) -> Generator[ParseResult, None, None]:
     """
     Parse the given source code file (or all files from the given project).
+
+    Parameters
+    ----------
+    path : pathlib.Path or str
+        The filename to parse.
+
+    input_format : str, optional
+        The input format (loader) to use.  See :func:`load_file_by_name`.
+
+    jobs : int, optional
+        The number of processes to parse with.  Defaults to 1, parsing
+        serially in this process.  ``None`` or 0 uses one process per CPU.
+
+    **kwargs :
+        Passed through to :func:`parse_source_code`.
     """
-    for item in load_file_by_name(path, input_format=input_format):
-        yield from parse_item(item, **kwargs)
+    yield from parse_items(
+        load_file_by_name(path, input_format=input_format),
+        jobs=jobs,
+        **kwargs,
+    )
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for integers which must be 0 or greater."""
+    result = int(value)
+    if result < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, not {result}")
+    return result
 
 
 def build_arg_parser(argparser=None):
@@ -368,11 +582,21 @@ def build_arg_parser(argparser=None):
         help="Filter items to parse by name",
     )
 
+    argparser.add_argument(
+        "-j",
+        "--jobs",
+        type=_non_negative_int,
+        default=1,
+        help="Number of processes to parse with (0 for one per CPU)",
+    )
+
     return argparser
 
 
 def summarize(parsed: list[ParseResult]) -> summary.CodeSummary:
     """Get a code summary instance from one or more ParseResult instances."""
+    from . import summary
+
     return summary.CodeSummary.from_parse_results(parsed)
 
 
@@ -433,6 +657,7 @@ def main(
     include_meta: bool = True,
     filter_by_name: Optional[list[str]] = None,
     input_format: Optional[str] = None,
+    jobs: Optional[int] = 1,
 ) -> dict[str, list[ParseResult]]:
     """
     Parse the given source code/project.
@@ -469,11 +694,13 @@ def main(
                     continue
                 else:
                     logger.debug("Included by filter: %s", item.identifier)
-            yield from parse_item(item)
+            yield item
 
     all_results = []
     try:
-        for index, res in enumerate(get_items(), start=1):
+        # Results are yielded in order as soon as each is parsed:
+        parsed = parse_items(get_items(), jobs=jobs)
+        for index, res in enumerate(parsed, start=1):
             all_results.append(res)
             results_by_filename.setdefault(str(filename), []).append(res)
             if print_filename:
@@ -525,7 +752,7 @@ def main(
     if output_summary:
         summarized = summarize(all_results)
         if use_json:
-            print(dump_json(summary.CodeSummary, summarized, include_meta=include_meta))
+            print(dump_json(type(summarized), summarized, include_meta=include_meta))
         else:
             print(summarized)
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import hashlib
 import logging
 import pathlib
+import pickle
 from typing import (Any, ClassVar, Dict, Generator, Iterable, List, Optional,
                     Tuple, Type, Union)
 
@@ -20,8 +23,11 @@ from sphinx.util.docfields import Field, GroupedField
 from sphinx.util.nodes import make_refnode
 from sphinx.util.typing import OptionSpec
 
+import blark
+
 from . import summary, util
-from .parse import parse
+from .input import load_file_by_name
+from .parse import parse_items
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +36,22 @@ MODULE_PATH = pathlib.Path(__file__).parent.resolve()
 STATIC_PATH = MODULE_PATH / "docs"
 DEFAULT_CSS_FILE = STATIC_PATH / "blark_default.css"
 
+#: Linkable declaration kind (LinkableItems attribute) to section title.
+LINKABLE_TITLES = {
+    "input": "Inputs",
+    "output": "Outputs",
+    "memory": "Memory",
+}
+
 
 @dataclasses.dataclass
 class BlarkSphinxCache:
     cache: Dict[pathlib.Path, summary.CodeSummary] = dataclasses.field(
         default_factory=dict
     )
+    by_name: Dict[str, summary.Summary] = dataclasses.field(
+        default_factory=dict
+    )
     _instance_: ClassVar[BlarkSphinxCache]
 
     @staticmethod
@@ -45,6 +61,13 @@ class BlarkSphinxCache:
         return BlarkSphinxCache._instance_
 
     def find_by_name(self, name: str):
+        try:
+            return self.by_name[name]
+        except KeyError:
+            if "." not in name:
+                raise KeyError(f"{name!r} not found") from None
+
+        # Qualified names (e.g., FB_Name.variable) require a full search
         for item in self.cache.values():
             obj = item.find(name)
             if obj is not None:
@@ -52,12 +75,127 @@ class BlarkSphinxCache:
 
         raise KeyError(f"{name!r} not found")
 
+    def update_index(self) -> None:
+        """Update the ``by_name`` index of top-level code objects."""
+        self.by_name.clear()
+        for item in self.cache.values():
+            # Precedence matches CodeSummary.get_item_by_name()
+            for dct in (
+                item.globals,
+                item.programs,
+                item.functions,
+                item.function_blocks,
+                item.data_types,
+            ):
+                for name, obj in dct.items():
+                    self.by_name.setdefault(name, obj)
+
     def configure(self, app: sphinx.application.Sphinx, config):
+        cache_path = pathlib.Path(app.doctreedir) / "blark"
+        # Projects may be listed more than once (e.g., by relative and absolute
+        # path); only summarize each once per run.
+        summaries: Dict[pathlib.Path, summary.CodeSummary] = {}
         for filename in config.blark_projects:
+            resolved = pathlib.Path(filename).resolve()
+            if resolved in summaries:
+                logger.debug("Already loaded %s", filename)
+                self.cache[pathlib.Path(filename)] = summaries[resolved]
+                continue
+
             logger.debug("Loading %s", filename)
-            for fn, info in parse(filename):
-                logger.debug("Parsed %s", fn)
-                self.cache[fn] = summary.CodeSummary.from_source(info)
+            items = load_file_by_name(filename)
+            source_hash = _get_source_hash(items)
+            summary_cache = cache_path / f"{_get_path_hash(filename)}.pickle"
+
+            code_summary = _load_cached_summary(summary_cache, source_hash)
+            if code_summary is None:
+                code_summary = self._summarize(items, jobs=config.blark_parse_jobs)
+                _save_cached_summary(summary_cache, source_hash, code_summary)
+            else:
+                logger.debug("Source unchanged; using cached summary for %s", filename)
+
+            summaries[resolved] = code_summary
+            self.cache[pathlib.Path(filename)] = code_summary
+
+        self.update_index()
+
+    @staticmethod
+    def _summarize(items, jobs: Optional[int] = 1) -> summary.CodeSummary:
+        """Parse and summarize the given source items."""
+        results = []
+        for result in parse_items(items, jobs=jobs):
+            if result.exception is not None:
+                logger.error(
+                    "Failed to parse %s %s: %s",
+                    result.filename, result.identifier, result.exception,
+                )
+                continue
+            logger.debug("Parsed %s %s", result.filename, result.identifier)
+            results.append(result)
+
+        return summary.CodeSummary.from_parse_results(results)
+
+
+def _get_path_hash(filename: util.AnyPath) -> str:
+    """Get a short, filesystem-safe key for the given filename."""
+    path = str(pathlib.Path(filename).resolve())
+    return hashlib.blake2b(path.encode(), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_blark_hash() -> str:
+    """
+    Hash blark's own source code and grammar.
+
+    The version alone does not change when a development checkout is edited,
+    which would leave stale summaries in the cache.
+    """
+    hasher = hashlib.blake2b(blark.__version__.encode(), digest_size=16)
+    for path in sorted(MODULE_PATH.glob("*.py")) + sorted(MODULE_PATH.glob("*.lark")):
+        hasher.update(path.name.encode())
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+def _get_source_hash(items) -> str:
+    """Hash the source code (and filenames) of the given items."""
+    hasher = hashlib.blake2b(_get_blark_hash().encode(), digest_size=16)
+    for item in items:
+        code, _ = item.get_code_and_line_map()
+        filenames = sorted(str(fn) for fn in item.get_filenames())
+        hasher.update("\n".join(filenames).encode())
+        hasher.update(code.encode())
+    return hasher.hexdigest()
+
+
+def _load_cached_summary(
+    path: pathlib.Path, source_hash: str
+) -> Optional[summary.CodeSummary]:
+    """Load a summary from the on-disk cache, if it matches ``source_hash``."""
+    try:
+        with open(path, "rb") as fp:
+            cached_hash, code_summary = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Failed to load cached summary %s", path, exc_info=True)
+        return None
+
+    if cached_hash != source_hash:
+        return None
+    return code_summary
+
+
+def _save_cached_summary(
+    path: pathlib.Path, source_hash: str, code_summary: summary.CodeSummary
+) -> None:
+    """Save a summary to the on-disk cache."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as fp:
+            pickle.dump((source_hash, code_summary), fp)
+    except Exception:
+        logger.warning("Failed to cache summary to %s", path, exc_info=True)
 
 
 class BlarkDirective(ObjectDescription[Tuple[str, str]]):
@@ -358,20 +496,14 @@ class BlarkDirectiveWithDeclarations(BlarkDirective):
     def before_content(self) -> None:
         self.env.ref_context['bk:obj'] = self.obj
 
-    def _get_links(self) -> Generator[addnodes.desc, None, None]:
+    def _get_links(
+        self, linkable: summary.LinkableItems
+    ) -> Generator[addnodes.desc, None, None]:
         """Get the linkable inputs/outputs as sphinx nodes."""
-        linkable = summary.get_linkable_declarations(
-            self.obj.declarations.values()
-        )
-        for attr in ("input", "output", "memory"):
+        for attr, name in LINKABLE_TITLES.items():
             decls = getattr(linkable, attr, [])
             if decls:
                 block_desc = addnodes.desc(classes=["linkable"])
-                name = {
-                    "input": "Inputs",
-                    "output": "Outputs",
-                    "memory": "Memory",
-                }[attr]
                 sig = addnodes.desc_signature(
                     classes=[f"linkable_{attr}"],
                     ids=[f"{self.obj.name}._linkable_{attr}_"],
@@ -412,8 +544,12 @@ class BlarkDirectiveWithDeclarations(BlarkDirective):
         )
 
     def transform_content(self, contentnode: addnodes.desc_content) -> None:
+        # Shared by the link table and the index entries:
+        linkable = summary.get_linkable_declarations(
+            self.obj.declarations.values()
+        )
         if "nolinks" not in self.options:
-            contentnode += self._get_links()
+            contentnode += self._get_links(linkable)
 
         if "noblocks" not in self.options:
             contentnode += self._get_basic_variable_blocks()
@@ -422,15 +558,14 @@ class BlarkDirectiveWithDeclarations(BlarkDirective):
             contentnode += self._get_source()
 
         if "noindexentry" not in self.options:
-            self._add_index_entries()
+            self._add_index_entries(linkable)
 
-    def _add_index_entries(self):
+    def _add_index_entries(self, linkable: summary.LinkableItems):
         self.indexnode["entries"].append(
             ("single", self.obj.name, self.obj.name, "", None)
         )
 
-        linkable = summary.get_linkable_declarations(self.obj.declarations.values())
-        for attr in ("input", "output", "memory"):
+        for attr in LINKABLE_TITLES:
             decls = getattr(linkable, attr, [])
             for decl in decls:
                 self.indexnode["entries"].append(
@@ -548,11 +683,17 @@ class BlarkDomain(Domain):
         # BlarkModuleIndex,
     ]
 
-    def find_obj(self, rolename, node, targetstring):
+    def __init__(self, env):
+        super().__init__(env)
+        # Role name to object type name, where the first object type wins
+        self._object_type_by_role: Dict[str, str] = {}
         for typename, objtype in self.object_types.items():
-            if rolename in objtype.roles:
-                break
-        else:
+            for role in objtype.roles:
+                self._object_type_by_role.setdefault(str(role), typename)
+
+    def find_obj(self, rolename, node, targetstring):
+        typename = self._object_type_by_role.get(rolename, None)
+        if typename is None:
             return []
         # TODO: scoping?
         # parent_obj = self.env.ref_context.get("bk:function", None)
@@ -579,14 +720,12 @@ class BlarkDomain(Domain):
         )
 
     def clear_doc(self, docname):
-        for name in self.initial_data:
-            for name, methods in self.env.domaindata["bk"][name].items():
-                to_delete = []
-                for idx, method in enumerate(methods):
-                    if method["docname"] == docname:
-                        to_delete.insert(0, idx)
-                for idx in to_delete:
-                    methods.pop(idx)
+        for typename in self.initial_data:
+            for signodes in self.env.domaindata["bk"][typename].values():
+                signodes[:] = [
+                    signode for signode in signodes
+                    if signode["docname"] != docname
+                ]
 
 
 def _initialize_domain(app: sphinx.application.Sphinx, config):
@@ -598,6 +737,7 @@ def _initialize_domain(app: sphinx.application.Sphinx, config):
 def setup(app: sphinx.application.Sphinx):
     app.add_config_value('blark_projects', [], 'html')
     app.add_config_value('blark_signature_show_type', True, 'html')
+    app.add_config_value('blark_parse_jobs', 1, '')
 
     app.add_domain(BlarkDomain)
     app.connect("config-inited", _initialize_domain)
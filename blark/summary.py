@@ -982,11 +982,9 @@ class CodeSummary:
             self.function_blocks,
             self.data_types,
         ):
-            # Very inefficient, be warned
-            try:
-                yield dct[name]
-            except KeyError:
-                ...
+            item = dct.get(name, None)
+            if item is not None:
+                yield item
 
     def get_item_by_name(self, name: str) -> Optional[Any]:
         """Get any code item (function, data type, global variable, etc.) by name."""
@@ -3,7 +3,9 @@ import functools
 import json
 import os
 import pathlib
+from typing import Any, Dict, List, Optional, Tuple
 
+import lark
 import pytest
 
 from ..dependency_store import DependencyStore
@@ -17,7 +19,17 @@ except ImportError:
     # apischema is optional for serialization testing
     apischema = None
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; it only speeds up JSON output for debugging
+    orjson = None
+
 APISCHEMA_SKIP = apischema is None
+# Set BLARK_TRACE=1 to print serialization round-trip details:
+TRACE = os.environ.get("BLARK_TRACE", "") == "1"
+# Set by the --fast-serde command-line option; see pytest_configure()
+FAST_SERDE = False
 # Dependency store:
 DS_CONFIG_ROOT = TEST_PATH / "twincat_root"
 DS_CONFIG = DS_CONFIG_ROOT / "config.json"
@@ -31,21 +43,138 @@ if additional_pous.exists():
 
 structured_text_filenames = list(str(path) for path in TEST_PATH.glob("**/*.st"))
 
+# Parsers by (start rules, sorted keyword arguments); see get_grammar()
+_grammar_cache: Dict[Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]], Any] = {}
+
+
+class StartRuleParser:
+    """
+    A view of a multi-start-rule parser, bound to a single starting rule.
+
+    Building an Earley parser is expensive, and Lark cannot cache or pickle
+    one.  Rule-level tests instead share a single parser built with every
+    grammar rule as a start symbol, using one of these per rule.
+    """
+
+    def __init__(self, parser: lark.Lark, start: str):
+        self.parser = parser
+        self.start = start
+        self.options = lark.lark.LarkOptions({**parser.options.options, "start": [start]})
+
+    def parse(self, text: str, start: Optional[str] = None, on_error=None) -> lark.Tree:
+        return self.parser.parse(text, start=start or self.start, on_error=on_error)
+
+    def __getattr__(self, attr):
+        return getattr(self.parser, attr)
+
+
+@functools.lru_cache(maxsize=None)
+def get_all_rules_grammar() -> lark.Lark:
+    """Get a parser which accepts any (non-inlined) grammar rule as a start rule."""
+    rules = {str(rule.origin.name) for rule in get_grammar().rules}
+    return new_parser(
+        import_paths=[TEST_PATH.parent],
+        start=sorted(rule for rule in rules if not rule.startswith("_")),
+    )
+
 
-@functools.lru_cache(maxsize=100)
 def get_grammar(*, start=None, **kwargs):
+    """Get a parser for the given starting rule(s) and options, cached by both."""
+    if isinstance(start, str):
+        start = [start]
+
+    key = (tuple(start or ["start"]), tuple(sorted(kwargs.items())))
+    parser = _grammar_cache.get(key, None)
+    if parser is None:
+        parser = _grammar_cache[key] = _new_grammar(list(key[0]), **kwargs)
+    return parser
+
+
+def _new_grammar(start: List[str], **kwargs):
+    if len(start) == 1 and start != ["start"] and not kwargs:
+        parser = get_all_rules_grammar()
+        if start[0] in parser.options.start:
+            return StartRuleParser(parser, start[0])
+
     return new_parser(
         import_paths=[TEST_PATH.parent],
-        start=start or ["start"],
+        start=start,
         **kwargs
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def grammar():
     return get_grammar()
 
 
+def _dumps(obj) -> str:
+    """Dump ``obj`` to indented JSON, using orjson if available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast-serde",
+        action="store_true",
+        default=False,
+        help=(
+            "Skip comparing source code after serialization round-trips "
+            "(only checks that objects serialize and deserialize)"
+        ),
+    )
+
+
+def pytest_configure(config):
+    global FAST_SERDE
+    FAST_SERDE = config.getoption("--fast-serde")
+
+
+@functools.lru_cache(maxsize=None)
+def _serialization_method():
+    """
+    Get the (cached) apischema serialization method.
+
+    Like ``apischema.serialize(obj)``, this serializes as ``Any``, dispatching
+    on each value's runtime type rather than its declared field type.
+    """
+    return apischema.serialization_method(
+        Any,
+        exclude_defaults=True,
+        no_copy=True,
+        fall_back_on_any=True,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _deserialization_method(cls: type):
+    """Get the (cached) apischema deserialization method for ``cls``."""
+    return apischema.deserialization_method(cls, no_copy=True)
+
+
+def _shallow_asdict(obj, depth: int = 3):
+    """
+    ``dataclasses.asdict``, but only ``depth`` dataclasses deep.
+
+    Deeper dataclasses are summarized by their type name, keeping failure
+    diagnostics small for large code trees.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        if depth <= 0:
+            return f"<{type(obj).__name__} ...>"
+        return {
+            field.name: _shallow_asdict(getattr(obj, field.name), depth - 1)
+            for field in dataclasses.fields(obj)
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_shallow_asdict(value, depth) for value in obj]
+    if isinstance(obj, dict):
+        return {key: _shallow_asdict(value, depth) for key, value in obj.items()}
+    return obj
+
+
 def check_serialization(
     obj, deserialize: bool = True, require_same_source: bool = True
 ):
@@ -63,31 +192,32 @@ def check_serialization(
         return
 
     try:
-        serialized = apischema.serialize(
-            obj,
-            exclude_defaults=True,
-            no_copy=True,
-        )
+        serialized = _serialization_method()(obj)
     except Exception:
-        print(dataclasses.asdict(obj))
+        print(_shallow_asdict(obj))
         raise
 
-    print(f"Serialized {type(obj)} to:")
-    print(json.dumps(serialized, indent=2))
-    print()
+    if TRACE:
+        print(f"Serialized {type(obj)} to:")
+        print(_dumps(serialized))
+        print()
 
     if not deserialize:
         return serialized, None
 
-    deserialized = apischema.deserialize(type(obj), serialized, no_copy=True)
+    deserialized = _deserialization_method(type(obj))(serialized)
+    # Source code generation walks the whole tree; only do it once
+    require_same_source = require_same_source and not FAST_SERDE
+    deserialized_source = str(deserialized) if TRACE or require_same_source else None
 
-    print(f"Deserialized {type(obj)} back to:")
-    print(repr(deserialized))
-    print("Or:")
-    print(deserialized)
+    if TRACE:
+        print(f"Deserialized {type(obj)} back to:")
+        print(repr(deserialized))
+        print("Or:")
+        print(deserialized_source)
 
     if require_same_source:
-        assert str(obj) == str(deserialized), \
+        assert str(obj) == deserialized_source, \
             "Deserialized object does not produce identical source code"
 
     return serialized, deserialized
@@ -173,6 +173,23 @@ def test_blark_main(monkeypatch, input_filename: str, args: List[str], skip_summ
         assert ex.code == 0
 
 
+def test_parse_jobs(monkeypatch):
+    # Parallel parsing itself is covered in test_parsing; one file will do here
+    filename = str(conftest.TEST_PATH / "POUs" / "F_SetStateParams.TcPOU")
+    monkeypatch.setattr(sys, "argv", ["blark", "parse", "--jobs", "2", filename])
+    try:
+        blark_main()
+    except SystemExit as ex:
+        assert ex.code == 0
+
+
+def test_parse_negative_jobs(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["blark", "parse", "--jobs", "-2", "filename"])
+    with pytest.raises(SystemExit) as ex:
+        blark_main()
+    assert ex.value.code == 2
+
+
 def test_readme_examples(monkeypatch, readme_line: str):
     def debug_session(**kwargs):
         print("(Should enter debug session here)", list(kwargs))
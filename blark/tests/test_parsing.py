@@ -4,7 +4,9 @@ import pytest
 
 from blark.util import SourceType
 
-from ..parse import parse, parse_source_code, summarize
+from ..input import BlarkSourceItem
+from ..parse import (new_parser, parse, parse_items, parse_source_code,
+                     summarize)
 from . import conftest
 
 TEST_PATH = pathlib.Path(__file__).parent
@@ -97,3 +99,73 @@ must_fail = pytest.mark.xfail(reason="Bad input", strict=True)
 def test_rule_smoke(grammar, name, value):
     result = conftest.get_grammar(start=name).parse(value)
     print(f"rule {name} value {value!r} into {result}")
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        pytest.param("integer_literal", "12"),
+        pytest.param("integer_literal", "UDINT#12"),
+    ],
+)
+def test_lalr_rule_smoke(name, value):
+    parser = new_parser(start=[name], parser="lalr")
+    assert parser.options.parser == "lalr"
+    result = parser.parse(value)
+    print(f"rule {name} value {value!r} into {result}")
+
+
+def test_parse_items_jobs():
+    items = [
+        BlarkSourceItem.from_code(
+            "PROGRAM prog_a VAR a : INT; END_VAR a := 1; END_PROGRAM"
+        ),
+        BlarkSourceItem.from_code(
+            "PROGRAM prog_b VAR b : INT; END_VAR b := ; END_PROGRAM"
+        ),
+        BlarkSourceItem.from_code(
+            "PROGRAM prog_c VAR c : INT; END_VAR c := 3; END_PROGRAM"
+        ),
+    ]
+    serial = list(parse_items(items, jobs=1))
+    parallel = list(parse_items(items, jobs=2))
+
+    assert [res.item for res in parallel] == items
+    for expected, res in zip(serial, parallel):
+        assert type(res.exception) is type(expected.exception)
+        assert res.tree == expected.tree
+        if res.tree is not None:
+            assert str(res.transform()) == str(expected.transform())
+
+
+def test_parse_items_jobs_unpicklable_kwargs():
+    items = [
+        BlarkSourceItem.from_code(
+            "PROGRAM prog_a VAR a : INT; END_VAR a := 1; END_PROGRAM"
+        ),
+        BlarkSourceItem.from_code(
+            "PROGRAM prog_b VAR b : INT; END_VAR b := 2; END_PROGRAM"
+        ),
+    ]
+    # A lambda can't be sent to worker processes; this should parse serially
+    results = list(parse_items(items, jobs=2, preprocessors=[lambda code: code]))
+    assert [res.item for res in results] == items
+    assert all(res.exception is None for res in results)
+
+
+def test_parse_items_negative_jobs():
+    items = [BlarkSourceItem.from_code("PROGRAM prog_a END_PROGRAM")]
+    with pytest.raises(ValueError):
+        list(parse_items(items, jobs=-1))
+
+
+def test_parse_jobs(twincat_pou_filename: str):
+    serial = list(parse(twincat_pou_filename, jobs=1))
+    parallel = list(parse(twincat_pou_filename, jobs=2))
+    assert [res.identifier for res in parallel] == [res.identifier for res in serial]
+    assert [res.tree for res in parallel] == [res.tree for res in serial]
+
+
+def test_new_parser_without_positions():
+    parser = new_parser(start=["integer_literal"], propagate_positions=False)
+    assert parser.parse("INT#12").meta.empty
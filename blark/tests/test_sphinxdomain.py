@@ -0,0 +1,130 @@
+import pathlib
+import types
+
+import pytest
+
+pytest.importorskip("sphinx")
+
+from .. import sphinxdomain  # noqa: E402
+from ..input import BlarkSourceItem  # noqa: E402
+from ..sphinxdomain import BlarkSphinxCache  # noqa: E402
+
+FB_SOURCE = """\
+FUNCTION_BLOCK {name}
+VAR_INPUT
+    iValue : INT;
+END_VAR
+END_FUNCTION_BLOCK
+"""
+
+
+@pytest.fixture
+def summarize_calls(monkeypatch) -> list:
+    """Record each time a project is parsed and summarized (not cached)."""
+    calls = []
+    summarize = BlarkSphinxCache._summarize
+
+    def wrapped(items, jobs=1):
+        calls.append(items)
+        return summarize(items, jobs=jobs)
+
+    monkeypatch.setattr(BlarkSphinxCache, "_summarize", staticmethod(wrapped))
+    return calls
+
+
+def configure(tmp_path: pathlib.Path, project: pathlib.Path) -> BlarkSphinxCache:
+    app = types.SimpleNamespace(doctreedir=tmp_path / "doctrees")
+    config = types.SimpleNamespace(blark_projects=[str(project)], blark_parse_jobs=1)
+    cache = BlarkSphinxCache()
+    cache.configure(app, config)
+    return cache
+
+
+def test_configure_cache(tmp_path: pathlib.Path, summarize_calls: list):
+    project = tmp_path / "project.st"
+    project.write_text(FB_SOURCE.format(name="fb_first"))
+
+    cache = configure(tmp_path, project)
+    assert len(summarize_calls) == 1
+    assert cache.find_by_name("fb_first").name == "fb_first"
+
+    # Unchanged source: the summary comes from the on-disk cache
+    cache = configure(tmp_path, project)
+    assert len(summarize_calls) == 1
+    assert cache.find_by_name("fb_first").name == "fb_first"
+
+    # Edited source: the cached summary is stale
+    project.write_text(FB_SOURCE.format(name="fb_second"))
+    cache = configure(tmp_path, project)
+    assert len(summarize_calls) == 2
+    assert cache.find_by_name("fb_second").name == "fb_second"
+    with pytest.raises(KeyError):
+        cache.find_by_name("fb_first")
+
+
+def test_configure_corrupt_cache(tmp_path: pathlib.Path, summarize_calls: list):
+    project = tmp_path / "project.st"
+    project.write_text(FB_SOURCE.format(name="fb_first"))
+    configure(tmp_path, project)
+
+    (cached,) = (tmp_path / "doctrees" / "blark").glob("*.pickle")
+    cached.write_bytes(b"not a pickle")
+
+    cache = configure(tmp_path, project)
+    assert len(summarize_calls) == 2
+    assert cache.find_by_name("fb_first").name == "fb_first"
+
+
+def test_source_hash_includes_blark(tmp_path: pathlib.Path, monkeypatch):
+    project = tmp_path / "project.st"
+    project.write_text(FB_SOURCE.format(name="fb_first"))
+    items = sphinxdomain.load_file_by_name(project)
+
+    source_hash = sphinxdomain._get_source_hash(items)
+    # e.g., blark itself was edited in a development checkout
+    monkeypatch.setattr(sphinxdomain, "_get_blark_hash", lambda: "edited")
+    assert sphinxdomain._get_source_hash(items) != source_hash
+
+
+def summarize(*sources: str):
+    items = [BlarkSourceItem.from_code(source) for source in sources]
+    return BlarkSphinxCache._summarize(items)
+
+
+def test_index_precedence():
+    project = summarize(
+        FB_SOURCE.format(name="shared"),
+        "PROGRAM shared\nEND_PROGRAM\n",
+    )
+    cache = BlarkSphinxCache(cache={pathlib.Path("project"): project})
+    cache.update_index()
+    assert cache.find_by_name("shared") is project.get_item_by_name("shared")
+    assert cache.find_by_name("shared") is project.programs["shared"]
+
+
+def test_index_first_project_wins():
+    first = summarize(FB_SOURCE.format(name="fb_common"))
+    second = summarize(
+        FB_SOURCE.format(name="fb_common"),
+        FB_SOURCE.format(name="fb_second"),
+    )
+    cache = BlarkSphinxCache(
+        cache={pathlib.Path("first"): first, pathlib.Path("second"): second}
+    )
+    cache.update_index()
+    assert cache.find_by_name("fb_common") is first.function_blocks["fb_common"]
+    assert cache.find_by_name("fb_second") is second.function_blocks["fb_second"]
+    with pytest.raises(KeyError):
+        cache.find_by_name("fb_missing")
+
+
+def test_index_dotted_name():
+    project = summarize(FB_SOURCE.format(name="fb_common"))
+    cache = BlarkSphinxCache(cache={pathlib.Path("project"): project})
+    cache.update_index()
+    assert "fb_common.iValue" not in cache.by_name
+    decl = cache.find_by_name("fb_common.iValue")
+    assert decl is project.find("fb_common.iValue")
+    assert decl.name == "iValue"
+    with pytest.raises(KeyError):
+        cache.find_by_name("fb_common.iMissing")
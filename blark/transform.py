@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import enum
 import functools
+import inspect
 import pathlib
 import textwrap
 import typing
@@ -3230,6 +3231,18 @@ def _annotator_method_wrapper(handler):
     return wrapped
 
 
+def _get_rule_handlers(cls: type) -> Dict[str, Callable]:
+    """Get all potential rule handlers of a transformer class, by name."""
+    handlers = {}
+    for base in reversed(cls.__mro__):
+        for name, obj in vars(base).items():
+            if inspect.isfunction(obj):
+                handlers[name] = obj
+            else:
+                handlers.pop(name, None)
+    return handlers
+
+
 class GrammarTransformer(lark.visitors.Transformer_InPlaceRecursive):
     """
     Grammar transformer which takes lark objects and makes a :class:`SourceCode`.
@@ -3244,6 +3257,7 @@ class GrammarTransformer(lark.visitors.Transformer_InPlaceRecursive):
         transformed grammar.
     """
     _filename: Optional[pathlib.Path]
+    _handlers: ClassVar[Dict[str, Callable]]
     comments: List[lark.Token]
 
     def __init__(
@@ -3252,11 +3266,16 @@ class GrammarTransformer(lark.visitors.Transformer_InPlaceRecursive):
         fn: Optional[AnyPath] = None,
         source_code: Optional[str] = None,
     ):
-        super().__init__()
+        # There are no terminal-specific handlers; skip visiting tokens.
+        super().__init__(visit_tokens=False)
         self._filename = pathlib.Path(fn) if fn else None
         self._source_code = source_code
         self.comments = comments or []
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._handlers = _get_rule_handlers(cls)
+
     locals().update(
         **dict(
             (str(name), _annotator_wrapper(handler))
@@ -3352,12 +3371,14 @@ class GrammarTransformer(lark.visitors.Transformer_InPlaceRecursive):
         easier to follow.  May break based on upstream API.
         """
         children = new_children if new_children is not None else tree.children
-        try:
-            handler = getattr(self, tree.data)
-        except AttributeError:
+        handler = self._handlers.get(tree.data, None)
+        if handler is None:
             return self.__default__(tree.data, children, tree.meta)
 
-        return handler(tree.data, children, tree.meta)
+        return handler(self, tree.data, children, tree.meta)
+
+
+GrammarTransformer._handlers = _get_rule_handlers(GrammarTransformer)
 
 
 def merge_comments(source: Any, comments: List[lark.Token]):
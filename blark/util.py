@@ -21,6 +21,8 @@ OPEN_COMMENT = "(*"
 CLOSE_COMMENT = "*)"
 OPEN_PRAGMA = "{"
 CLOSE_PRAGMA = "}"
+# Characters (or pairs of characters) relevant to comment/pragma/string state:
+RE_COMMENT_SCAN = re.compile(r"\(\*|\*\)|//|[{}$'\"]")
 
 
 class SourceType(enum.Enum):
@@ -332,22 +334,12 @@ def find_and_clean_comments(
     lines = text.splitlines()
     original_lines = list(lines)
     multiline_comments = []
-    in_single_comment = False
     in_single_quote = False
     in_double_quote = False
     pragma_state = []
-    skip = 0
 
     comments_and_pragmas: List[lark.Token] = []
 
-    def get_characters() -> Generator[Tuple[int, int, str, str], None, None]:
-        """Yield line information and characters."""
-        for lineno, line in enumerate(text.splitlines()):
-            colno = 0
-            for colno, (this_ch, next_ch) in enumerate(zip(line, line[1:] + "\n")):
-                yield lineno, colno, this_ch, next_ch
-            yield lineno, colno, "\n", ""
-
     def fix_line(lineno: int, colno: int) -> str:
         """Uncomment a nested multiline comment at (line, col)."""
         replacement_line = list(lines[lineno])
@@ -404,69 +396,71 @@ def find_and_clean_comments(
             # token.end_line = line_map.get(end_line + 1, end_line + 1)
         return token
 
-    for lineno, colno, this_ch, next_ch in get_characters():
-        if skip:
-            skip -= 1
-            continue
-
-        if in_single_comment:
-            in_single_comment = this_ch not in NEWLINES
-            continue
-
-        pair = this_ch + next_ch
-        if not in_single_quote and not in_double_quote:
-            if this_ch == OPEN_PRAGMA and not multiline_comments:
-                pragma_state.append((lineno, colno))
-                continue
-            if this_ch == CLOSE_PRAGMA and not multiline_comments:
-                start_line, start_col = pragma_state.pop(-1)
-                if len(pragma_state) == 0:
-                    comments_and_pragmas.append(
-                        get_token(start_line, start_col, lineno, colno + 1)
-                    )
+    for lineno, line in enumerate(original_lines):
+        # Only the characters matched by RE_COMMENT_SCAN affect the state
+        # below; jump directly between them rather than walking every one.
+        next_colno = 0
+        for match in RE_COMMENT_SCAN.finditer(line):
+            colno = match.start()
+            if colno < next_colno:
+                # Skipped as part of the previous pair (e.g., an escape)
                 continue
 
-            if pragma_state:
-                continue
-
-            if pair == OPEN_COMMENT:
-                multiline_comments.append((lineno, colno))
-                skip = 1
-                if len(multiline_comments) > 1:
-                    # Nested multi-line comment
-                    lines[lineno] = fix_line(lineno, colno)
-                continue
-            if pair == CLOSE_COMMENT:
-                start_line, start_col = multiline_comments.pop(-1)
-                if len(multiline_comments) > 0:
-                    # Nested multi-line comment
-                    lines[lineno] = fix_line(lineno, colno)
-                else:
+            next_colno = match.end()
+            this_ch = line[colno]
+            next_ch = line[colno + 1] if colno + 1 < len(line) else "\n"
+            pair = this_ch + next_ch
+            if not in_single_quote and not in_double_quote:
+                if this_ch == OPEN_PRAGMA and not multiline_comments:
+                    pragma_state.append((lineno, colno))
+                    continue
+                if this_ch == CLOSE_PRAGMA and not multiline_comments:
+                    start_line, start_col = pragma_state.pop(-1)
+                    if len(pragma_state) == 0:
+                        comments_and_pragmas.append(
+                            get_token(start_line, start_col, lineno, colno + 1)
+                        )
+                    continue
+
+                if pragma_state:
+                    continue
+
+                if pair == OPEN_COMMENT:
+                    multiline_comments.append((lineno, colno))
+                    if len(multiline_comments) > 1:
+                        # Nested multi-line comment
+                        lines[lineno] = fix_line(lineno, colno)
+                    continue
+                if pair == CLOSE_COMMENT:
+                    start_line, start_col = multiline_comments.pop(-1)
+                    if len(multiline_comments) > 0:
+                        # Nested multi-line comment
+                        lines[lineno] = fix_line(lineno, colno)
+                    else:
+                        comments_and_pragmas.append(
+                            get_token(start_line, start_col, lineno, colno + 1)
+                        )
+                    continue
+                if pair == SINGLE_COMMENT:
                     comments_and_pragmas.append(
-                        get_token(start_line, start_col, lineno, colno + 1)
+                        get_token(lineno, colno, lineno, len(lines[lineno]))
                     )
-                skip = 1
-                continue
-            if pair == SINGLE_COMMENT:
-                in_single_comment = True
-                comments_and_pragmas.append(
-                    get_token(lineno, colno, lineno, len(lines[lineno]))
-                )
-                continue
-
-        if not multiline_comments and not in_single_comment:
-            if pair == "$'" and in_single_quote:
-                # This is an escape for single quotes
-                skip = 1
-            elif pair == '$"' and in_double_quote:
-                # This is an escape for double quotes
-                skip = 1
-            elif this_ch == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-            elif this_ch == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-            elif pair == SINGLE_COMMENT:
-                in_single_comment = True
+                    # The remainder of the line is part of the comment
+                    break
+
+            if not multiline_comments:
+                if pair == "$'" and in_single_quote:
+                    # This is an escape for single quotes
+                    next_colno = colno + 2
+                elif pair == '$"' and in_double_quote:
+                    # This is an escape for double quotes
+                    next_colno = colno + 2
+                elif this_ch == "'" and not in_double_quote:
+                    in_single_quote = not in_single_quote
+                elif this_ch == '"' and not in_single_quote:
+                    in_double_quote = not in_double_quote
+                elif pair == SINGLE_COMMENT:
+                    break
 
     if multiline_comments or in_single_quote or in_double_quote:
         # Syntax error in source? Return the original and let lark fail